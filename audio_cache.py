@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def default_cache_dir():
+    """Return the on-disk cache directory (overridable with SIGHT_WORDS_CACHE)."""
+    return os.environ.get(
+        "SIGHT_WORDS_CACHE",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".audio_cache"),
+    )
+
+
+def cache_key(text, voice, lang_code, sample_rate):
+    """Content address of a synthesized clip."""
+    payload = "\x1f".join([text, voice, lang_code, str(sample_rate)])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Synthesized prompt audio, kept in an in-memory LRU and backed by .npy files."""
+
+    def __init__(self, cache_dir=None, max_items=64):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        # Clips from pre-rendered bundles stay resident and never get evicted
+        self._pinned = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".npy")
+
+    def _remember(self, key, audio):
+        # Caller holds the lock
+        self._memory[key] = audio
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached clip for key, or None."""
+        with self._lock:
+            audio = self._pinned.get(key)
+            if audio is not None:
+                return audio
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                return audio
+
+        try:
+            audio = np.load(self._path(key))
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+        with self._lock:
+            self._remember(key, audio)
+        return audio
+
+    def put(self, key, audio):
+        """Store a clip in memory and on disk; returns the stored float32 array."""
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        with self._lock:
+            self._remember(key, audio)
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a torn clip
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write audio cache entry {key}: {e}")
+        return audio
+
+    def load_bundle(self, bundle_dir):
+        """Pin every clip listed in a pre-rendered bundle's manifest.json.
+
+        Returns the number of clips loaded; a missing bundle loads nothing.
+        """
+        try:
+            with open(os.path.join(bundle_dir, "manifest.json"), 'r') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return 0
+
+        loaded = {}
+        for word, entry in manifest.get("prompts", {}).items():
+            try:
+                loaded[entry["key"]] = np.load(os.path.join(bundle_dir, entry["file"]))
+            except (KeyError, OSError, ValueError) as e:
+                print(f"Skipping pre-rendered prompt for '{word}': {e}")
+
+        with self._lock:
+            self._pinned.update(loaded)
+        return len(loaded)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._pinned or key in self._memory:
+                return True
+        return os.path.exists(self._path(key))
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
@@ -0,0 +1,104 @@
+import itertools
+import queue
+import threading
+
+import numpy as np
+
+# How often the Tk main loop collects finished requests
+POLL_MS = 30
+
+# Request priorities: a prompt the child is waiting for beats warming the cache
+SPEAK = 0
+PREFETCH = 1
+
+
+class AudioWorker:
+    """Runs prompt synthesis and playback on a background thread.
+
+    stream(text, word) yields audio chunks (from cache or straight out of
+    the speech backend) and player receives them as they arrive, so a
+    prompt starts playing as soon as its first chunk exists.
+
+    The UI only enqueues requests. Completion callbacks are queued by the
+    worker and run on the Tk main thread from a root.after poll, so no Tk
+    call ever happens off the main thread.
+    """
+
+    def __init__(self, stream, player):
+        self.stream = stream
+        self.player = player
+        self._jobs = queue.PriorityQueue()
+        self._done = queue.Queue()
+        self._order = itertools.count()
+        self._generation = 0
+        self._thread = None
+        self._lock = threading.Lock()
+        self._root = None
+
+    def attach(self, root):
+        """Deliver completion callbacks through root's event loop."""
+        if root is self._root:
+            return
+        self._root = root
+        root.after(POLL_MS, self._poll, root)
+
+    def speak(self, text, word=None, on_done=None):
+        """Synthesize (or fetch from cache) and play text.
+
+        A newer speak request supersedes any that have not started yet.
+        on_done(audio) runs on the main thread with the whole clip once
+        the last chunk has been handed to the player.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self._submit(SPEAK, (text, word, generation, on_done))
+
+    def prefetch(self, text, word=None):
+        """Synthesize text into the cache without playing it."""
+        self._submit(PREFETCH, (text, word, None, None))
+
+    def wait_idle(self):
+        """Block until every queued request has been handled."""
+        self._jobs.join()
+
+    def _submit(self, priority, job):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audio-worker", daemon=True)
+                self._thread.start()
+        self._jobs.put((priority, next(self._order), job))
+
+    def _run(self):
+        while True:
+            priority, order, (text, word, generation, on_done) = self._jobs.get()
+            try:
+                if generation is not None and generation != self._generation:
+                    continue  # The child has already moved on
+                chunks = []
+                for chunk in self.stream(text, word):
+                    # Once superseded, keep synthesizing so the clip still gets
+                    # cached, but stop sending it to the speakers
+                    if generation is not None and generation == self._generation:
+                        if not chunks:
+                            self.player.begin()
+                        self.player.feed(chunk)
+                    chunks.append(chunk)
+                audio = np.concatenate(chunks) if chunks else None
+                if on_done is not None:
+                    self._done.put((on_done, audio))
+            except Exception as e:
+                print(f"Audio request failed for {text!r}: {e}")
+            finally:
+                self._jobs.task_done()
+
+    def _poll(self, root):
+        if root is not self._root:
+            return
+        while True:
+            try:
+                callback, audio = self._done.get_nowait()
+            except queue.Empty:
+                break
+            callback(audio)
+        root.after(POLL_MS, self._poll, root)
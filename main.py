@@ -1,25 +1,67 @@
+import time
+
+# Cold-start reference point for the startup budget
+STARTED_AT = time.perf_counter()
+
+import argparse
 import tkinter as tk
 from tkinter import messagebox, PhotoImage
 import random
 import json
-import pyttsx3
+import threading
+from collections import deque
 from PIL import Image, ImageTk
-from kokoro import KPipeline
-import soundfile as sf
-import sounddevice as sd
-import torch
-
-pipeline = KPipeline(lang_code='a')
-text = '''
-[Kokoro](/kˈOkəɹO/) is an open-weight TTS model with 82 million parameters. Despite its lightweight architecture, it delivers comparable quality to larger models while being significantly faster and more cost-efficient. With Apache-licensed weights, [Kokoro](/kˈOkəɹO/) can be deployed anywhere from production environments to personal projects.
-'''
-generator = pipeline(text, voice='af_heart')
-for i, (gs, ps, audio) in enumerate(generator):
-    print(i, gs, ps)
-    sf.write(f'{i}.wav', audio, 24000)
-
-# Initialize text-to-speech engine
-engine = pyttsx3.init()
+import numpy as np
+from audio_cache import AudioCache
+from audio_worker import AudioWorker
+from playback import StreamPlayer
+from prerender import bundle_dir
+from speech import BACKENDS, DEFAULT_BACKEND, get_backend, prompt_text
+
+# Cold start to first paint should stay under this many seconds
+STARTUP_BUDGET_S = 1.5
+
+# Backend used for every prompt. Templates may choose one with a "speech"
+# entry; --speech on the command line pins it for the whole run.
+speech_backend = get_backend(DEFAULT_BACKEND)
+speech_pinned = False
+
+# Synthesized prompts, shared by next_question and replay_word
+audio_cache = AudioCache()
+
+
+def use_speech_backend(backend, pin=False):
+    global speech_backend, speech_pinned
+    speech_backend = backend
+    speech_pinned = speech_pinned or pin
+
+
+def prompt_chunks(text, word=None):
+    """Yield a prompt's audio, streaming from the backend on a cache miss."""
+    backend = speech_backend
+    key = backend.cache_key(text) if backend.cacheable else None
+    if key is not None:
+        audio = audio_cache.get(key)
+        if audio is not None:
+            yield audio
+            return
+
+    chunks = []
+    for chunk in backend.stream(text, word):
+        chunks.append(chunk)
+        yield chunk
+    if key is not None and chunks:
+        audio_cache.put(key, np.concatenate(chunks))
+
+
+# One output stream for the whole run; prompts are fed in as they synthesize
+player = StreamPlayer()
+
+# How many upcoming questions get their audio synthesized ahead of time
+PREFETCH_DEPTH = 2
+
+# Synthesis and playback run here so the Tk main loop never blocks on Kokoro
+audio_worker = AudioWorker(prompt_chunks, player)
 
 class SightWordGame:
     def __init__(self, root, template_file="templates/basic.json"):
@@ -27,11 +69,13 @@ class SightWordGame:
         self.score = 0
         self.total_questions = 10  # Number of questions in the game
         self.word_to_guess = None
+        self.upcoming_words = deque()
         self.word_buttons = []
         self.image_dict = {}
         self.template = None
         self.background_image = None
 
+        audio_worker.attach(root)
         self.load_template(template_file)
 
         self.next_question()
@@ -42,6 +86,13 @@ class SightWordGame:
             with open(template_file, 'r') as f:
                 self.template = json.load(f)
 
+            if not speech_pinned:
+                speech = dict(self.template.get("speech", {}))
+                use_speech_backend(get_backend(speech.pop("backend", DEFAULT_BACKEND), **speech))
+
+            # Pick up prompts rendered ahead of time by prerender.py
+            audio_cache.load_bundle(bundle_dir(template_file))
+
             # Set window title
             self.root.title(self.template.get("title", "Sight Word Game"))
 
@@ -109,13 +160,20 @@ class SightWordGame:
 
     def replay_word(self):
         if self.word_to_guess:
-            # Use kokoro to generate and play the sound
-            text = f"The word to click is... \"{self.word_to_guess}\""
-            generator = pipeline(text, voice='af_heart')
-            for i, (gs, ps, audio) in enumerate(generator):
-                # Play the sound directly without saving to disk
-                sd.play(audio, 24000)
-                break
+            # Use kokoro to generate and play the sound in the background
+            audio_worker.speak(prompt_text(self.word_to_guess), self.word_to_guess)
+
+    def plan_ahead(self, available_words):
+        """Draw words for the current and next PREFETCH_DEPTH questions.
+
+        Returns the newly drawn words so their audio can be prefetched.
+        """
+        planned = []
+        while len(self.upcoming_words) < min(PREFETCH_DEPTH + 1, self.total_questions):
+            word = random.choice(available_words)
+            self.upcoming_words.append(word)
+            planned.append(word)
+        return planned
 
     def next_question(self):
         if self.total_questions > 0:
@@ -126,14 +184,14 @@ class SightWordGame:
                 print("No word images available.")
                 return
 
-            self.word_to_guess = random.choice(available_words)
-            # Use kokoro to generate and play the sound
-            text = f"The word to click is... \"{self.word_to_guess}\""
-            generator = pipeline(text, voice='af_heart')
-            for i, (gs, ps, audio) in enumerate(generator):
-                # Play the sound directly without saving to disk
-                sd.play(audio, 24000)
-                break
+            planned = self.plan_ahead(available_words)
+            self.word_to_guess = self.upcoming_words.popleft()
+            # Use kokoro to generate and play the sound in the background
+            audio_worker.speak(prompt_text(self.word_to_guess), self.word_to_guess)
+            # Synthesize the next words while the child reads this screen
+            for word in planned:
+                if word != self.word_to_guess:
+                    audio_worker.prefetch(prompt_text(word), word)
             self.total_questions -= 1
 
             # Clear previous word buttons and other widgets except background image
@@ -207,10 +265,36 @@ class SightWordGame:
             messagebox.showinfo("Game Over", f"Your score is {self.score}/{self.total_questions} ({percentage}%).")
             self.root.quit()
 
+def report_startup(root, started_at=STARTED_AT):
+    """Paint the window and report how long the cold start took."""
+    root.update()
+    elapsed = time.perf_counter() - started_at
+    status = "within" if elapsed <= STARTUP_BUDGET_S else "OVER"
+    print(f"Startup to first paint: {elapsed:.3f}s ({status} budget of {STARTUP_BUDGET_S:.1f}s)")
+    return elapsed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sight Word Game")
+    parser.add_argument("--template", default="templates/basic.json", help="template JSON file")
+    parser.add_argument("--speech", choices=sorted(BACKENDS),
+                        help="speech backend, overriding the template's choice")
+    parser.add_argument("--clip-dir", help="directory of recorded clips for --speech clips")
+    return parser.parse_args(argv)
+
+
 # Start the game
 if __name__ == "__main__":
+    args = parse_args()
+    if args.speech:
+        options = {"clip_dir": args.clip_dir} if args.speech == "clips" and args.clip_dir else {}
+        use_speech_backend(get_backend(args.speech, **options), pin=True)
+
     print("Welcome to the Sight Word Game!")
     root = tk.Tk()
     root.geometry("800x600")
-    game = SightWordGame(root, template_file="templates/basic.json")
+    game = SightWordGame(root, template_file=args.template)
+    report_startup(root)
+    # Load the model in the background now that the window is up
+    threading.Thread(target=speech_backend.load, name="speech-warmup", daemon=True).start()
     root.mainloop()
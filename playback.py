@@ -0,0 +1,80 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+from speech import SAMPLE_RATE
+
+
+class StreamPlayer:
+    """Plays mono float32 chunks through one long-lived sounddevice stream.
+
+    Chunks are queued as soon as they are synthesized and the device
+    callback drains them, so sound starts with the first chunk while later
+    ones are still being generated. Keeping the stream open also saves
+    reopening the device for every prompt.
+    """
+
+    def __init__(self, sample_rate=SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._chunks = deque()
+        self._current = None
+        self._position = 0
+        self._lock = threading.Lock()
+        self._stream = None
+
+    def begin(self):
+        """Cut off whatever is playing and start a new utterance."""
+        with self._lock:
+            self._chunks.clear()
+            self._current = None
+            self._position = 0
+        self._ensure_stream()
+
+    def feed(self, chunk):
+        """Queue a chunk to play after everything already fed."""
+        chunk = np.asarray(chunk, dtype=np.float32).reshape(-1)
+        if len(chunk):
+            with self._lock:
+                self._chunks.append(chunk)
+
+    def play(self, audio):
+        self.begin()
+        self.feed(audio)
+
+    @property
+    def idle(self):
+        with self._lock:
+            return self._current is None and not self._chunks
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def _ensure_stream(self):
+        if self._stream is None:
+            import sounddevice as sd
+            self._stream = sd.OutputStream(samplerate=self.sample_rate, channels=1,
+                                           dtype='float32', callback=self._callback)
+            self._stream.start()
+
+    def _callback(self, outdata, frames, time_info, status):
+        out = outdata[:, 0]
+        filled = 0
+        with self._lock:
+            while filled < frames:
+                if self._current is None:
+                    if not self._chunks:
+                        break
+                    self._current = self._chunks.popleft()
+                    self._position = 0
+                take = min(frames - filled, len(self._current) - self._position)
+                out[filled:filled + take] = self._current[self._position:self._position + take]
+                filled += take
+                self._position += take
+                if self._position >= len(self._current):
+                    self._current = None
+        # Silence once the queue runs dry
+        out[filled:] = 0
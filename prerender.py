@@ -0,0 +1,97 @@
+"""Pre-render the prompt audio for every word in one or more templates.
+
+Usage: python prerender.py templates/basic.json templates/fire_scenario.json
+
+Each template gets a bundle directory next to it (templates/basic.audio/)
+holding manifest.json and one .npy clip per word. The game loads the bundle
+when the template is loaded, so no inference runs while a child is waiting.
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from speech import SAMPLE_RATE, VOICE, KokoroBackend, prompt_text
+
+MANIFEST = "manifest.json"
+
+
+def bundle_dir(template_file):
+    """Directory holding the pre-rendered audio for a template."""
+    return os.path.splitext(template_file)[0] + ".audio"
+
+
+def template_words(template_file):
+    with open(template_file, 'r') as f:
+        template = json.load(f)
+    return list(template.get("images", {}))
+
+
+def write_clip(path, audio):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.asarray(audio, dtype=np.float32))
+    os.replace(tmp_path, path)
+
+
+def prerender(template_files, backend=None, force=False):
+    """Synthesize every template's prompts in a single pass through one backend."""
+    backend = backend or KokoroBackend()
+    # Collect the work first so each distinct prompt is synthesized once,
+    # even when several templates share a word
+    plans = []
+    prompts = {}
+    for template_file in template_files:
+        entries = {}
+        out_dir = bundle_dir(template_file)
+        os.makedirs(out_dir, exist_ok=True)
+        for word in template_words(template_file):
+            text = prompt_text(word)
+            key = backend.cache_key(text)
+            file_name = key + ".npy"
+            entries[word] = {"text": text, "key": key, "file": file_name}
+            if force or not os.path.exists(os.path.join(out_dir, file_name)):
+                prompts.setdefault(key, (text, []))[1].append(os.path.join(out_dir, file_name))
+        plans.append((template_file, out_dir, entries))
+
+    if prompts:
+        backend.load()
+        for key, (text, paths) in prompts.items():
+            audio = backend.synthesize(text)
+            if audio is None:
+                print(f"No audio produced for {text!r}. Skipping.")
+                continue
+            for path in paths:
+                write_clip(path, audio)
+            print(f"Rendered {text!r} ({len(audio) / SAMPLE_RATE:.2f}s)")
+
+    for template_file, out_dir, entries in plans:
+        rendered = {word: entry for word, entry in entries.items()
+                    if os.path.exists(os.path.join(out_dir, entry["file"]))}
+        manifest = {
+            "template": os.path.basename(template_file),
+            "backend": backend.name,
+            "voice": backend.voice,
+            "lang_code": backend.lang_code,
+            "sample_rate": backend.sample_rate,
+            "prompts": rendered,
+        }
+        with open(os.path.join(out_dir, MANIFEST), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        print(f"Wrote {len(rendered)} prompts to {out_dir}")
+
+    return [out_dir for _, out_dir, _ in plans]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render prompt audio for sight word templates.")
+    parser.add_argument("templates", nargs="+", help="template JSON files")
+    parser.add_argument("--voice", default=VOICE, help="Kokoro voice (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="re-render prompts that already exist")
+    args = parser.parse_args(argv)
+    prerender(args.templates, KokoroBackend(voice=args.voice), force=args.force)
+
+
+if __name__ == "__main__":
+    main()
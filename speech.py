@@ -0,0 +1,216 @@
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from audio_cache import cache_key
+
+VOICE = 'af_heart'
+LANG_CODE = 'a'
+SAMPLE_RATE = 24000
+
+DEFAULT_BACKEND = "kokoro"
+
+
+def prompt_text(word):
+    """The sentence spoken to ask for a word."""
+    return f"The word to click is... \"{word}\""
+
+
+def to_sample_rate(audio, rate, target_rate=SAMPLE_RATE):
+    """Convert mono audio to target_rate with linear interpolation."""
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if rate == target_rate or len(audio) == 0:
+        return audio
+    frames = int(round(len(audio) * target_rate / rate))
+    positions = np.arange(frames, dtype=np.float64) * (rate / target_rate)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+class LazyPipeline:
+    """A Kokoro KPipeline that is only built the first time it is needed.
+
+    Importing kokoro and loading the model takes seconds, so nothing happens
+    until the first synthesis (normally on the audio worker thread) or an
+    explicit load() from a background warm-up.
+    """
+
+    def __init__(self, lang_code=LANG_CODE):
+        self.lang_code = lang_code
+        self._pipeline = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._pipeline is not None
+
+    def load(self):
+        with self._lock:
+            if self._pipeline is None:
+                from kokoro import KPipeline
+                self._pipeline = KPipeline(lang_code=self.lang_code)
+        return self._pipeline
+
+    def __call__(self, text, voice=VOICE):
+        return self.load()(text, voice=voice)
+
+
+class SpeechBackend:
+    """Turns prompt text into mono float32 audio at SAMPLE_RATE.
+
+    Subclasses implement stream(), yielding chunks as they are produced.
+    """
+
+    name = None
+    voice = ""
+    lang_code = ""
+    sample_rate = SAMPLE_RATE
+    # Whether clips are worth keeping in the AudioCache
+    cacheable = True
+
+    def load(self):
+        """Do any slow setup ahead of the first prompt."""
+
+    def cache_key(self, text):
+        return cache_key(text, self.voice, self.lang_code, self.sample_rate)
+
+    def stream(self, text, word=None):
+        raise NotImplementedError
+
+    def synthesize(self, text, word=None):
+        """Return the whole clip for text, or None if there is nothing to play."""
+        chunks = list(self.stream(text, word))
+        if not chunks:
+            return None
+        return np.concatenate(chunks)
+
+
+class KokoroBackend(SpeechBackend):
+    """Neural voice; best quality, needs a few seconds of CPU per prompt."""
+
+    name = "kokoro"
+
+    def __init__(self, voice=VOICE, lang_code=LANG_CODE, pipeline=None):
+        self.voice = voice
+        self.lang_code = lang_code
+        self.pipeline = pipeline or LazyPipeline(lang_code)
+
+    def load(self):
+        if isinstance(self.pipeline, LazyPipeline):
+            self.pipeline.load()
+
+    def stream(self, text, word=None):
+        for gs, ps, audio in self.pipeline(text, voice=self.voice):
+            yield np.asarray(audio, dtype=np.float32)
+
+
+class Pyttsx3Backend(SpeechBackend):
+    """The operating system's voice through pyttsx3; robotic but near-instant."""
+
+    name = "pyttsx3"
+
+    def __init__(self, voice=None, rate=None):
+        self.voice = f"pyttsx3:{voice or 'default'}:{rate or 'default'}"
+        self._voice_id = voice
+        self._rate = rate
+        self._engine = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        with self._lock:
+            if self._engine is None:
+                import pyttsx3
+                self._engine = pyttsx3.init()
+                if self._voice_id:
+                    self._engine.setProperty('voice', self._voice_id)
+                if self._rate:
+                    self._engine.setProperty('rate', self._rate)
+        return self._engine
+
+    def stream(self, text, word=None):
+        import soundfile as sf
+
+        engine = self.load()
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            # pyttsx3 engines are not thread-safe; keep one utterance at a time
+            with self._lock:
+                engine.save_to_file(text, path)
+                engine.runAndWait()
+            audio, rate = sf.read(path, dtype='float32')
+        finally:
+            os.remove(path)
+        if len(audio):
+            yield to_sample_rate(audio, rate, self.sample_rate)
+
+
+class ClipBackend(SpeechBackend):
+    """Prerecorded clips, one file per word, e.g. clips/the.wav."""
+
+    name = "clips"
+    cacheable = False
+    extensions = (".wav", ".flac", ".ogg")
+
+    def __init__(self, clip_dir="clips"):
+        self.clip_dir = clip_dir
+        self._clips = {}
+
+    def clip_path(self, word):
+        for extension in self.extensions:
+            path = os.path.join(self.clip_dir, word + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def stream(self, text, word=None):
+        if word is None:
+            return
+        audio = self._clips.get(word)
+        if audio is None:
+            path = self.clip_path(word)
+            if path is None:
+                print(f"No recorded clip for '{word}' in {self.clip_dir}.")
+                return
+            import soundfile as sf
+            audio, rate = sf.read(path, dtype='float32')
+            audio = self._clips[word] = to_sample_rate(audio, rate, self.sample_rate)
+        yield audio
+
+
+class NullBackend(SpeechBackend):
+    """Silence, for tests, benchmarks and machines without audio."""
+
+    name = "null"
+    cacheable = False
+
+    def stream(self, text, word=None):
+        return iter(())
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (KokoroBackend, Pyttsx3Backend, ClipBackend, NullBackend)
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name=DEFAULT_BACKEND, **options):
+    """Return the shared backend for name and options, creating it once.
+
+    Reusing instances means switching back to a template's backend does not
+    reload its model.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown speech backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    key = (name, tuple(sorted(options.items())))
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = _backends[key] = BACKENDS[name](**options)
+    return backend
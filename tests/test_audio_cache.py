@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from audio_cache import AudioCache, cache_key
+
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = AudioCache(self.cache_dir, max_items=2)
+
+    def test_key_depends_on_every_field(self):
+        """Test that text, voice, lang_code and sample rate all change the key."""
+        base = cache_key("the", "af_heart", "a", 24000)
+        self.assertEqual(base, cache_key("the", "af_heart", "a", 24000))
+        self.assertNotEqual(base, cache_key("and", "af_heart", "a", 24000))
+        self.assertNotEqual(base, cache_key("the", "am_adam", "a", 24000))
+        self.assertNotEqual(base, cache_key("the", "af_heart", "b", 24000))
+        self.assertNotEqual(base, cache_key("the", "af_heart", "a", 48000))
+
+    def test_put_and_get(self):
+        """Test that a stored clip comes back as float32."""
+        self.cache.put("k1", [0.1, 0.2])
+        audio = self.cache.get("k1")
+        self.assertEqual(audio.dtype, np.float32)
+        np.testing.assert_allclose(audio, [0.1, 0.2])
+        self.assertIn("k1", self.cache)
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_lru_eviction_falls_back_to_disk(self):
+        """Test that evicted clips are reloaded from disk."""
+        for i in range(3):
+            self.cache.put(f"k{i}", np.full(4, i, dtype=np.float32))
+        self.assertNotIn("k0", self.cache._memory)
+        np.testing.assert_array_equal(self.cache.get("k0"), np.zeros(4))
+
+    def test_survives_restart(self):
+        """Test that a new cache instance sees clips written by an old one."""
+        self.cache.put("k1", np.ones(3, dtype=np.float32))
+        restarted = AudioCache(self.cache_dir)
+        np.testing.assert_array_equal(restarted.get("k1"), np.ones(3))
+        leftovers = [name for _, _, files in os.walk(self.cache_dir) for name in files if name.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
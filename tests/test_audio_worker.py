@@ -0,0 +1,107 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from audio_worker import AudioWorker
+
+
+class FakePlayer:
+    def __init__(self):
+        self.utterances = []
+
+    def begin(self):
+        self.utterances.append([])
+
+    def feed(self, chunk):
+        self.utterances[-1].append(chunk)
+
+
+class TestAudioWorker(unittest.TestCase):
+    def setUp(self):
+        self.synthesized = []
+        self.player = FakePlayer()
+        self.worker = AudioWorker(self.stream, self.player)
+
+    def stream(self, text, word=None):
+        self.synthesized.append((text, threading.current_thread().name))
+        yield np.array([1.0], dtype=np.float32)
+        yield np.array([2.0, 3.0], dtype=np.float32)
+
+    def played(self):
+        return [[chunk.tolist() for chunk in utterance] for utterance in self.player.utterances]
+
+    def test_speak_runs_off_main_thread(self):
+        """Test that synthesis and playback happen on the worker thread."""
+        self.worker.speak("the")
+        self.worker.wait_idle()
+        self.assertEqual(self.synthesized, [("the", "audio-worker")])
+        self.assertEqual(self.played(), [[[1.0], [2.0, 3.0]]])
+
+    def test_prefetch_does_not_play(self):
+        """Test that prefetching only synthesizes."""
+        self.worker.prefetch("and")
+        self.worker.wait_idle()
+        self.assertEqual([text for text, _ in self.synthesized], ["and"])
+        self.assertEqual(self.played(), [])
+
+    def test_chunks_reach_player_while_streaming(self):
+        """Test that the first chunk is playing before the last is synthesized."""
+        fed_before_second = []
+
+        def stream(text, word=None):
+            yield np.array([1.0], dtype=np.float32)
+            fed_before_second.append(self.played())
+            yield np.array([2.0], dtype=np.float32)
+
+        self.worker.stream = stream
+        self.worker.speak("the")
+        self.worker.wait_idle()
+        self.assertEqual(fed_before_second, [[[[1.0]]]])
+
+    def test_newer_speak_supersedes_pending(self):
+        """Test that a queued prompt is dropped when a newer one arrives."""
+        started, gate = threading.Event(), threading.Event()
+
+        def slow_stream(text, word=None):
+            started.set()
+            gate.wait()
+            yield np.array([len(text)], dtype=np.float32)
+
+        self.worker.stream = slow_stream
+        self.worker.prefetch("block")
+        started.wait()
+        self.worker.speak("old")
+        self.worker.speak("new!")
+        gate.set()
+        self.worker.wait_idle()
+        self.assertEqual(self.played(), [[[4.0]]])
+
+    def test_callbacks_run_from_root_after(self):
+        """Test that completion callbacks are delivered by the Tk poll."""
+        root = MagicMock()
+        self.worker.attach(root)
+        poll = root.after.call_args[0][1]
+
+        results = []
+        self.worker.speak("to", on_done=results.append)
+        self.worker.wait_idle()
+        self.assertEqual(results, [])
+
+        poll(root)
+        self.assertEqual([audio.tolist() for audio in results], [[1.0, 2.0, 3.0]])
+        self.assertEqual(root.after.call_count, 2)
+
+    def test_failure_does_not_kill_worker(self):
+        """Test that one failed request does not stop later ones."""
+        self.worker.stream = MagicMock(side_effect=[RuntimeError("boom"), [np.zeros(1)]])
+        self.worker.speak("x")
+        self.worker.wait_idle()
+        self.worker.speak("a")
+        self.worker.wait_idle()
+        self.assertEqual(self.played(), [[[0.0]]])
+
+
+if __name__ == '__main__':
+    unittest.main()
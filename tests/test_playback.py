@@ -0,0 +1,48 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from playback import StreamPlayer
+
+
+class TestStreamPlayer(unittest.TestCase):
+    def setUp(self):
+        self.sounddevice = MagicMock()
+        patcher = patch.dict(sys.modules, {'sounddevice': self.sounddevice})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.player = StreamPlayer(sample_rate=24000)
+
+    def pull(self, frames):
+        outdata = np.full((frames, 1), 9.0, dtype=np.float32)
+        self.player._callback(outdata, frames, None, None)
+        return outdata[:, 0].tolist()
+
+    def test_stream_opened_once(self):
+        """Test that one output stream is reused across prompts."""
+        self.player.begin()
+        self.player.begin()
+        self.sounddevice.OutputStream.assert_called_once()
+        self.assertEqual(self.sounddevice.OutputStream.call_args.kwargs['samplerate'], 24000)
+
+    def test_chunks_play_back_to_back(self):
+        """Test that chunks fed while playing are joined without gaps."""
+        self.player.begin()
+        self.player.feed([1, 2, 3])
+        self.assertEqual(self.pull(2), [1, 2])
+        self.player.feed([4])
+        self.assertEqual(self.pull(4), [3, 4, 0, 0])
+        self.assertTrue(self.player.idle)
+
+    def test_begin_cuts_off_previous_prompt(self):
+        """Test that a new prompt replaces whatever is still queued."""
+        self.player.play([1, 1, 1, 1])
+        self.pull(1)
+        self.player.play([5])
+        self.assertEqual(self.pull(2), [5, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from audio_cache import AudioCache
+from prerender import bundle_dir, prerender
+from speech import KokoroBackend, prompt_text
+
+
+class FakePipeline:
+    """Stands in for KPipeline, yielding two chunks per prompt."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text, voice):
+        self.calls.append(text)
+        return iter([(text, None, np.zeros(2, dtype=np.float32)),
+                     (text, None, np.ones(3, dtype=np.float32))])
+
+
+class TestPrerender(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.templates = []
+        for name, words in (("one", ["the", "and"]), ("two", ["the", "fire"])):
+            path = os.path.join(self.tmp, f"{name}.json")
+            with open(path, 'w') as f:
+                json.dump({"images": {w: f"images/{w}.png" for w in words}}, f)
+            self.templates.append(path)
+
+    def test_renders_each_prompt_once(self):
+        """Test that shared words are synthesized once across templates."""
+        pipeline = FakePipeline()
+        prerender(self.templates, KokoroBackend(pipeline=pipeline))
+        self.assertEqual(sorted(pipeline.calls), sorted(prompt_text(w) for w in ["the", "and", "fire"]))
+
+        with open(os.path.join(bundle_dir(self.templates[0]), "manifest.json")) as f:
+            manifest = json.load(f)
+        self.assertEqual(set(manifest["prompts"]), {"the", "and"})
+
+    def test_skips_existing_clips(self):
+        """Test that a second run does not load the model or re-render."""
+        prerender(self.templates, KokoroBackend(pipeline=FakePipeline()))
+        pipeline = MagicMock()
+        prerender(self.templates, KokoroBackend(pipeline=pipeline))
+        pipeline.assert_not_called()
+
+    def test_bundle_loads_into_cache(self):
+        """Test that the game cache serves the full pre-rendered clip."""
+        backend = KokoroBackend(pipeline=FakePipeline())
+        prerender(self.templates, backend)
+        cache = AudioCache(os.path.join(self.tmp, "cache"), max_items=0)
+        self.assertEqual(cache.load_bundle(bundle_dir(self.templates[1])), 2)
+        audio = cache.get(backend.cache_key(prompt_text("fire")))
+        np.testing.assert_array_equal(audio, [0, 0, 1, 1, 1])
+
+    def test_missing_bundle(self):
+        """Test that a template without a bundle loads nothing."""
+        cache = AudioCache(os.path.join(self.tmp, "cache"))
+        self.assertEqual(cache.load_bundle(os.path.join(self.tmp, "nothing.audio")), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import MagicMock, patch, Mock, call
 import tkinter as tk
+import os
 import random
 import sys
+import tempfile
 from PIL import Image, ImageTk
 
 # Mock various modules to avoid dependency issues
@@ -48,9 +50,14 @@ sys.modules['tkinter'] = mock_tk
 sys.modules['tkinter'].messagebox = mock_messagebox
 sys.modules['tkinter'].PhotoImage = mock_PhotoImage
 
+# Keep synthesized test audio out of the real on-disk cache
+os.environ['SIGHT_WORDS_CACHE'] = tempfile.mkdtemp()
+
 # Import the SightWordGame class and sight_words from main.py
 sys.path.append('/workspace/sight_words')
-from main import SightWordGame, engine
+import main
+from main import SightWordGame
+from audio_cache import AudioCache
 sight_words = ["the", "and", "a", "to", "said", "in", "is", "you", "that", "it"]
 
 class TestSightWordGame(unittest.TestCase):
@@ -80,6 +87,12 @@ class TestSightWordGame(unittest.TestCase):
         self.game.total_questions = 10
         self.game.score = 0
 
+        # Start every test with an empty audio cache
+        cache_patcher = patch('main.audio_cache', AudioCache(tempfile.mkdtemp()))
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.addCleanup(main.audio_worker.wait_idle)
+
     def test_initial_score(self):
         """Test that the initial score is 0."""
         # Reset the game's score
@@ -176,29 +189,41 @@ class TestSightWordGame(unittest.TestCase):
         # Mock the pipeline function
         mock_pipeline = MagicMock()
         mock_generator = MagicMock()
-        mock_audio = MagicMock()
+        mock_audio = np.array([0.1, 0.2], dtype=np.float32)
 
         # Setup the generator to return our mock audio
         mock_generator.__iter__.return_value = [(None, None, mock_audio)]
         mock_pipeline.return_value = mock_generator
 
-        with patch('main.pipeline', mock_pipeline):
+        with patch.object(main.speech_backend, 'pipeline', mock_pipeline):
             with patch('sounddevice.play') as mock_play:
                 self.game.replay_word()
+                main.audio_worker.wait_idle()
 
                 # Check that pipeline was called with the correct text
-                mock_pipeline.assert_called_with(f"The word to click is {self.game.word_to_guess}", voice='af_heart')
+                mock_pipeline.assert_called_with(f'The word to click is... "{self.game.word_to_guess}"', voice='af_heart')
 
                 # Check that play was called with the generated audio
                 mock_play.assert_called_once()
                 args, kwargs = mock_play.call_args
-                self.assertEqual(args[0], mock_audio)
+                np.testing.assert_array_equal(args[0], mock_audio)
                 # The samplerate parameter might be positional or named; check both ways
                 if len(args) > 1:
                     self.assertEqual(args[1], 24000)
                 else:
                     self.assertEqual(kwargs.get('samplerate'), 24000)
 
+    def test_replay_word_uses_cache(self):
+        """Test that replaying the same word only synthesizes it once."""
+        self.game.word_to_guess = "test"
+        mock_pipeline = MagicMock(return_value=iter([(None, None, np.array([0.1], dtype=np.float32))]))
+        with patch.object(main.speech_backend, 'pipeline', mock_pipeline), patch('sounddevice.play') as mock_play:
+            for _ in range(2):
+                self.game.replay_word()
+                main.audio_worker.wait_idle()
+        mock_pipeline.assert_called_once()
+        self.assertEqual(mock_play.call_count, 2)
+
     @patch('random.choice')
     def test_next_question_selects_random_word(self, mock_choice):
         """Test that next_question selects a random word from sight_words."""
@@ -212,6 +237,27 @@ class TestSightWordGame(unittest.TestCase):
         self.assertEqual(self.game.word_to_guess, "test")
         self.assertEqual(self.game.total_questions, 9)  # Should decrement by 1
 
+    def test_next_question_prefetches_upcoming_words(self):
+        """Test that the next words are planned and prefetched ahead of time."""
+        self.game.total_questions = 10
+        with patch('random.choice', side_effect=["the", "and", "a", "to"]), \
+             patch.object(main.audio_worker, 'speak') as mock_speak, \
+             patch.object(main.audio_worker, 'prefetch') as mock_prefetch:
+            self.game.next_question()
+            self.assertEqual(self.game.word_to_guess, "the")
+            mock_speak.assert_called_once_with('The word to click is... "the"', "the")
+            self.assertEqual(mock_prefetch.call_args_list,
+                             [call('The word to click is... "and"', "and"), call('The word to click is... "a"', "a")])
+
+            self.game.next_question()
+            self.assertEqual(self.game.word_to_guess, "and")
+            mock_prefetch.assert_called_with('The word to click is... "to"', "to")
+
+    def test_plan_ahead_stops_at_last_question(self):
+        """Test that no words are planned past the end of the game."""
+        self.game.total_questions = 1
+        self.assertEqual(len(self.game.plan_ahead(["the", "and"])), 1)
+
     def test_check_answer_correct(self):
         """Test that check_answer correctly identifies correct answers."""
         # Reset the game's score
@@ -252,7 +298,7 @@ class TestSightWordGame(unittest.TestCase):
     def test_replay_word(self):
         """Test that replay_word uses kokoro to generate sound."""
         self.game.word_to_guess = "test"
-        with patch('main.pipeline') as mock_pipeline:
+        with patch.object(main.speech_backend, 'pipeline') as mock_pipeline:
             # Mock audio data
             class MockGenerator:
                 def __call__(self, *args, **kwargs):
@@ -260,11 +306,12 @@ class TestSightWordGame(unittest.TestCase):
             mock_pipeline.return_value.__call__ = MockGenerator()
             with patch('sounddevice.play'):
                 self.game.replay_word()
-            mock_pipeline.assert_called_once_with('The word to click is test', voice='af_heart')
+                main.audio_worker.wait_idle()
+            mock_pipeline.assert_called_once_with('The word to click is... "test"', voice='af_heart')
 
     def test_next_question_audio(self):
         """Test that next_question uses kokoro to generate sound."""
-        with patch('main.pipeline') as mock_pipeline:
+        with patch.object(main.speech_backend, 'pipeline') as mock_pipeline:
             # Mock audio data
             class MockGenerator:
                 def __call__(self, *args, **kwargs):
@@ -276,7 +323,35 @@ class TestSightWordGame(unittest.TestCase):
                     # Patch winfo_children to return a list containing only the background image label
                     self.root.winfo_children = MagicMock(return_value=[MagicMock(spec=tk.Label, __class__=tk.Label, image=self.mock_background_image)])
                     self.game.next_question()
-                mock_pipeline.assert_called_once_with(f'The word to click is {self.game.word_to_guess}', voice='af_heart')
+                    main.audio_worker.wait_idle()
+                # The current prompt is synthesized first; the rest is prefetch
+                self.assertEqual(mock_pipeline.call_args_list[0],
+                                 call(f'The word to click is... "{self.game.word_to_guess}"', voice='af_heart'))
+
+    def test_template_selects_speech_backend(self):
+        """Test that a template's "speech" entry picks the backend unless pinned."""
+        template_file = os.path.join(tempfile.mkdtemp(), "quiet.json")
+        with open(template_file, 'w') as f:
+            f.write('{"speech": {"backend": "null"}, "images": {}}')
+
+        with patch.object(main, 'speech_backend', main.speech_backend), \
+             patch.object(SightWordGame, 'next_question', return_value=None):
+            SightWordGame(self.root, template_file=template_file)
+            self.assertEqual(main.speech_backend.name, "null")
+
+            with patch.object(main, 'speech_pinned', True):
+                SightWordGame(self.root, template_file="templates/basic.json")
+                self.assertEqual(main.speech_backend.name, "null")
+
+            SightWordGame(self.root, template_file="templates/basic.json")
+            self.assertEqual(main.speech_backend.name, "kokoro")
+
+    def test_report_startup(self):
+        """Test that startup time is measured after the first paint."""
+        elapsed = main.report_startup(self.root, started_at=main.time.perf_counter())
+        self.root.update.assert_called_once_with()
+        self.assertGreaterEqual(elapsed, 0)
+        self.assertLess(elapsed, main.STARTUP_BUDGET_S)
 
     def test_template_loading(self):
         """Test that the template loading functionality works correctly."""
@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from speech import (ClipBackend, KokoroBackend, LazyPipeline, NullBackend,
+                    get_backend, to_sample_rate)
+
+
+class TestLazyPipeline(unittest.TestCase):
+    def setUp(self):
+        self.kokoro = MagicMock()
+        self.kokoro.KPipeline.return_value.return_value = iter(
+            [("gs", "ps", np.ones(2)), ("gs", "ps", np.zeros(1))])
+        patcher = patch.dict(sys.modules, {'kokoro': self.kokoro})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_model_not_built_until_used(self):
+        """Test that constructing the backend does not load Kokoro."""
+        backend = KokoroBackend()
+        self.assertFalse(backend.pipeline.loaded)
+        self.kokoro.KPipeline.assert_not_called()
+
+    def test_model_built_once(self):
+        """Test that the model is built on first use and then reused."""
+        backend = KokoroBackend()
+        backend.load()
+        audio = backend.synthesize("hello")
+        self.assertTrue(backend.pipeline.loaded)
+        self.kokoro.KPipeline.assert_called_once_with(lang_code='a')
+        np.testing.assert_array_equal(audio, [1, 1, 0])
+
+
+class TestBackends(unittest.TestCase):
+    def test_null_backend_is_silent(self):
+        """Test that the null backend never produces audio."""
+        self.assertIsNone(NullBackend().synthesize("anything", "the"))
+
+    def test_get_backend_reuses_instances(self):
+        """Test that asking for the same backend twice returns one instance."""
+        self.assertIs(get_backend("null"), get_backend("null"))
+        self.assertIsNot(get_backend("clips", clip_dir="a"), get_backend("clips", clip_dir="b"))
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            get_backend("espeak-ng")
+
+    def test_cache_key_includes_voice(self):
+        """Test that different voices never share cached audio."""
+        self.assertNotEqual(KokoroBackend(voice="af_heart").cache_key("hi"),
+                            KokoroBackend(voice="am_adam").cache_key("hi"))
+
+    def test_clip_backend(self):
+        """Test that recorded clips are found by word and resampled."""
+        clip_dir = tempfile.mkdtemp()
+        open(os.path.join(clip_dir, "the.wav"), "wb").close()
+        soundfile = MagicMock()
+        soundfile.read.return_value = (np.ones(12000, dtype=np.float32), 12000)
+        backend = ClipBackend(clip_dir)
+        with patch.dict(sys.modules, {'soundfile': soundfile}):
+            self.assertEqual(len(backend.synthesize("prompt", "the")), 24000)
+            self.assertIsNone(backend.synthesize("prompt", "and"))
+            backend.synthesize("prompt", "the")
+        soundfile.read.assert_called_once()
+
+    def test_to_sample_rate(self):
+        """Test that stereo audio is mixed down and resampled."""
+        stereo = np.ones((100, 2), dtype=np.float32)
+        audio = to_sample_rate(stereo, 12000, 24000)
+        self.assertEqual(audio.shape, (200,))
+        self.assertEqual(audio.dtype, np.float32)
+
+
+if __name__ == '__main__':
+    unittest.main()